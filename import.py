@@ -1,45 +1,71 @@
+import csv
 import sqlite3
-import pandas as pd
 
-def clean_csv(path):
-    df = pd.read_csv(path)
-    df = df.loc[:, ~df.columns.str.contains("^Unnamed")]
-    return df
+# Cell values loaded as NULL (e.g. grants_clean.csv marks missing faculty as NULL)
+NULL_VALUES = {"", "NULL", "null", "NA", "N/A", "n/a", "#N/A", "<NA>", "NaN", "nan", "None"}
+
+def append_csv(path, table, conn):
+    # Stream CSV rows straight into executemany(), skipping pandas-style
+    # "Unnamed" index columns. utf-8-sig drops the BOM Excel adds on save.
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        keep = [i for i, col in enumerate(header) if col and not col.startswith("Unnamed")]
+        columns = ", ".join('"' + header[i].replace('"', '""') + '"' for i in keep)
+        placeholders = ", ".join("?" * len(keep))
+        # Short rows are padded with NULL, as pandas did
+        conn.executemany(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+            ([None if i >= len(row) or row[i] in NULL_VALUES else row[i] for i in keep]
+             for row in reader if row),
+        )
 
 conn = sqlite3.connect("cec.db")
 conn.execute("PRAGMA foreign_keys = ON")
 
-clean_csv("data/csv/departments.csv").to_sql(
-    "departments", conn, if_exists="append", index=False
-)
+# Bulk-load settings: the database is rebuilt from the CSVs on every run,
+# so durability can be traded for speed while importing.
+conn.execute("PRAGMA journal_mode = MEMORY")
+conn.execute("PRAGMA synchronous = OFF")
+conn.execute("PRAGMA temp_store = MEMORY")
+conn.execute("PRAGMA cache_size = -262144")
+conn.execute("BEGIN")
 
-capabilities_df = clean_csv("data/csv/capabilities.csv")
-capabilities_df[["capabilities_id", "capability_name"]].to_sql(
-    "capabilities", conn, if_exists="append", index=False
-)
+append_csv("data/csv/departments.csv", "departments", conn)
 
-cap_dept_rows = []
-for _, row in capabilities_df.iterrows():
-    cap_id = str(row["capabilities_id"]).strip()
-    departments = str(row["department_id"]).split(",")
-    for dept_id in departments:
-        dept_id = dept_id.strip()
-        if dept_id:
-            cap_dept_rows.append(
-                {"capabilities_id": cap_id, "department_id": dept_id}
-            )
+# Capabilities are staged as-is and split into capabilities and
+# capability_departments in SQL, so the comma-separated department_id
+# column is exploded by SQLite rather than in Python.
+conn.execute("""
+    CREATE TEMP TABLE capabilities_raw(
+        capabilities_id TEXT,
+        capability_name TEXT,
+        department_id TEXT
+    )
+""")
+append_csv("data/csv/capabilities.csv", "capabilities_raw", conn)
 
-pd.DataFrame(cap_dept_rows).to_sql(
-    "capability_departments", conn, if_exists="append", index=False
-)
+conn.execute("""
+    INSERT INTO capabilities (capabilities_id, capability_name)
+    SELECT capabilities_id, capability_name FROM capabilities_raw
+""")
 
-clean_csv("data/csv/faculty.csv").to_sql(
-    "faculty", conn, if_exists="append", index=False
-)
+conn.execute("""
+    INSERT INTO capability_departments (capabilities_id, department_id)
+    WITH RECURSIVE split(capabilities_id, department_id, rest) AS (
+        SELECT trim(capabilities_id), '', department_id || ',' FROM capabilities_raw
+        UNION ALL
+        SELECT capabilities_id,
+               trim(substr(rest, 1, instr(rest, ',') - 1)),
+               substr(rest, instr(rest, ',') + 1)
+        FROM split WHERE rest <> ''
+    )
+    SELECT capabilities_id, department_id FROM split WHERE department_id <> ''
+""")
 
-clean_csv("data/csv/grants_clean.csv").to_sql(
-    "grants", conn, if_exists="append", index=False
-)
+append_csv("data/csv/faculty.csv", "faculty", conn)
 
+append_csv("data/csv/grants_clean.csv", "grants", conn)
 
+conn.commit()
 conn.close()
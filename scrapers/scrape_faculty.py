@@ -9,7 +9,7 @@ HOW TO USE FOR OTHER COLLEGES:
 
 REQUIREMENTS:
 - data/departments.csv must exist with columns: department_id, department_name
-- BeautifulSoup4 and requests packages installed (see requirements.txt)
+- lxml and requests packages installed (see requirements.txt)
 
 CONFIGURATION:
 - TARGET_URL: The URL of the faculty page to scrape
@@ -17,13 +17,16 @@ CONFIGURATION:
 - DEPARTMENTS_FILE: Path to departments.csv for matching
 - USE_EMPTY_FOR_NO_MATCH: If True, unmatched departments will be empty string.
                            If False, scraped text will be included for manual review.
+- VERBOSE: If True, every unparsed paragraph is listed after scraping.
 """
 
 import requests
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
 import csv
 import os
 import re
+import sys
 from typing import List, Dict, Optional, Set
 
 # ============================================================================
@@ -52,13 +55,46 @@ FACULTY_ID_PREFIX = "F"
 # If False: unmatched departments will include the scraped text for manual review
 USE_EMPTY_FOR_NO_MATCH = True
 
+# If True: list every paragraph that could not be parsed
+# If False: only report how many paragraphs could not be parsed
+VERBOSE = False
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Sentence boundaries within a faculty entry (see parse_faculty_entry)
+_SENT_SPLIT = re.compile(r'\.\s+(?=[A-Z])|\.(?=\s*$)')
+
+# A standalone year marks an academic history sentence
+_YEAR_RE = re.compile(r'\b\d{4}\b')
+
+# Start of a CSV record, capturing the faculty ID number
+_FACULTY_ID_RE = re.compile(rf'^{re.escape(FACULTY_ID_PREFIX)}(\d+),')
+
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# WordSection1, WordSection2, ... divs below a node, compiled once
+_word_sections = lxml.etree.XPath('.//div[starts-with(@class, "WordSection")]')
+
+# Shared session so fetching several college pages reuses one connection
+SESSION = requests.Session()
+
+# A field made up only of these words is a plain job title (e.g. "Associate
+# Professor"), so it can't name a department. Any other word, including
+# "of", "in" or "for", sends the field through normal matching.
+_TITLE_WORDS = frozenset({
+    'Professor', 'Associate', 'Assistant', 'Research', 'Teaching', 'Term',
+    'Distinguished', 'University', 'Senior', 'Visiting', 'Clinical',
+    'Lecturer', 'Instructor', 'Dean', 'Chair', 'Emeritus', 'Emerita',
+    'Adjunct', 'Affiliate',
+})
+
+
 def load_departments(csv_path: str) -> Dict[str, str]:
     """
-    Load departments from CSV and return a mapping of department_name -> department_id.
+    Load departments from CSV and return a mapping of lowercased department_name -> department_id.
+    Names are lowercased once here so matching never has to re-lowercase them.
     Returns empty dict if file doesn't exist.
     """
     if not os.path.exists(csv_path):
@@ -73,7 +109,7 @@ def load_departments(csv_path: str) -> Dict[str, str]:
                 dept_name = row.get('department_name', '').strip()
                 dept_id = row.get('department_id', '').strip()
                 if dept_name and dept_id:
-                    departments[dept_name] = dept_id
+                    departments[dept_name.lower()] = dept_id
     except Exception as e:
         print(f"Error loading departments: {e}")
     
@@ -83,6 +119,7 @@ def load_departments(csv_path: str) -> Dict[str, str]:
 def fuzzy_match_department(text: str, departments: Dict[str, str]) -> Optional[str]:
     """
     Fuzzy/partial case-insensitive match of text against department names.
+    Expects the lowercased mapping returned by load_departments().
     Returns department_id if match found, None otherwise.
     """
     if not text or not departments:
@@ -91,13 +128,16 @@ def fuzzy_match_department(text: str, departments: Dict[str, str]) -> Optional[s
     text_lower = text.lower().strip()
     
     # Try exact match first (case-insensitive)
-    for dept_name, dept_id in departments.items():
-        if text_lower == dept_name.lower():
-            return dept_id
+    dept_id = departments.get(text_lower)
+    if dept_id:
+        return dept_id
+    
+    # Skip plain job titles (e.g. "Associate Professor") without scanning
+    if set(text.split()) <= _TITLE_WORDS:
+        return None
     
     # Try partial match - check if department name is contained in text
-    for dept_name, dept_id in departments.items():
-        dept_lower = dept_name.lower()
+    for dept_lower, dept_id in departments.items():
         if dept_lower in text_lower or text_lower in dept_lower:
             return dept_id
     
@@ -106,23 +146,36 @@ def fuzzy_match_department(text: str, departments: Dict[str, str]) -> Optional[s
 
 def get_next_faculty_id(existing_csv_path: str) -> int:
     """
-    Determine the next faculty ID by reading existing CSV.
+    Determine the next faculty ID from the last record of the existing CSV.
+    IDs are written sequentially, so only the tail of the file is read.
     Returns the next number to use (e.g., if F00005 exists, returns 6).
     """
     if not os.path.exists(existing_csv_path):
         return 1
     
     try:
-        with open(existing_csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            faculty_ids = [row['faculty_id'] for row in reader]
+        with open(existing_csv_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
             
-        if not faculty_ids:
-            return 1
-        
-        # Extract numbers from faculty IDs (e.g., "F00005" -> 5)
-        numbers = [int(fid.replace(FACULTY_ID_PREFIX, '')) for fid in faculty_ids]
-        return max(numbers) + 1
+            # Widen the window only if the last record doesn't fit in it
+            window = 4096
+            while True:
+                f.seek(max(0, size - window))
+                lines = f.read().decode('utf-8', errors='ignore').splitlines()
+                if size > window:
+                    # First line is most likely cut off mid-record
+                    lines = lines[1:]
+                
+                # Extract number from the last faculty ID (e.g., "F00005" -> 5)
+                for line in reversed(lines):
+                    match = _FACULTY_ID_RE.match(line)
+                    if match:
+                        return int(match.group(1)) + 1
+                
+                if window >= size:
+                    return 1
+                window *= 4
     except Exception as e:
         print(f"Warning: Could not read existing CSV: {e}")
         return 1
@@ -144,8 +197,7 @@ def parse_faculty_entry(entry_text: str, departments: Dict[str, str]) -> Optiona
     """
     # Split by period, handling middle initials (e.g., "Jan M.")
     # Split on ". " followed by uppercase letter or period at end
-    sentences = re.split(r'\.\s+(?=[A-Z])|\.(?=\s*$)', entry_text)
-    sentences = [s.strip() for s in sentences if s.strip()]
+    sentences = [s for s in map(str.strip, _SENT_SPLIT.split(entry_text)) if s]
     
     if len(sentences) == 0:
         return None
@@ -156,7 +208,7 @@ def parse_faculty_entry(entry_text: str, departments: Dict[str, str]) -> Optiona
     academic_parts = []
     
     for sentence in sentences:
-        if re.search(r'\b\d{4}\b', sentence):
+        if _YEAR_RE.search(sentence):
             academic_parts.append(sentence)
         else:
             # Main entry should have at least 2 commas (Last, First, ...)
@@ -182,8 +234,17 @@ def parse_faculty_entry(entry_text: str, departments: Dict[str, str]) -> Optiona
     if main_sentence is None:
         return None
     
-    # Parse comma-separated fields
-    fields = [f.strip() for f in main_sentence.split(',')]
+    # Text nodes keep the line breaks of the HTML source, so collapse whitespace
+    main_sentence = ' '.join(main_sentence.split())
+    
+    # Parse comma-separated fields; a fully quoted field may contain commas.
+    # Anything else with quotes in it (e.g. 'Smith, "Bob" Robert') is split
+    # on plain commas so the quotes are kept
+    try:
+        fields = next(csv.reader([main_sentence], skipinitialspace=True, strict=True))
+    except csv.Error:
+        fields = main_sentence.split(',')
+    fields = [f.strip() for f in fields]
     
     if len(fields) < 3:
         return None
@@ -271,14 +332,16 @@ def scrape_faculty(url: str, departments: Dict[str, str]) -> List[Dict[str, str]
     print(f"Fetching faculty data from: {url}")
     
     try:
-        response = requests.get(url, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error fetching URL: {e}")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    # The catalog is served as UTF-8; don't leave it to libxml2's guess
+    root = lxml.html.document_fromstring(response.content, parser=_HTML_PARSER)
     faculty_list = []
+    unparsed = []
     
     # Extract anchor from URL (e.g., #collegeofengineeringandcomputingtext)
     anchor_id = None
@@ -293,22 +356,22 @@ def scrape_faculty(url: str, departments: Dict[str, str]) -> List[Dict[str, str]
     # Try to find the specific container for this college
     target_container = None
     if container_id:
-        target_container = soup.find(id=container_id)
-        if target_container:
+        target_container = root.get_element_by_id(container_id, None)
+        if target_container is not None:
             print(f"✓ Found college container: {container_id}")
         else:
             # Try just the anchor ID
-            target_container = soup.find(id=anchor_id)
-            if target_container:
+            target_container = root.get_element_by_id(anchor_id, None)
+            if target_container is not None:
                 print(f"✓ Found college section: {anchor_id}")
             else:
                 print(f"⚠ Warning: Could not find container '{container_id}' or anchor '{anchor_id}'")
     
     # Determine which sections to scrape
-    if target_container:
+    if target_container is not None:
         # Found the specific college container
         # Check if it has WordSection divs inside
-        word_sections = target_container.find_all('div', class_=lambda x: x and x.startswith('WordSection'))
+        word_sections = _word_sections(target_container)
         
         if word_sections:
             sections_to_scrape = word_sections
@@ -321,23 +384,23 @@ def scrape_faculty(url: str, departments: Dict[str, str]) -> List[Dict[str, str]
         # Fallback: scrape all WordSection divs on page (risky - may include other colleges!)
         print(f"⚠ WARNING: Falling back to scraping ALL WordSection divs on page")
         print(f"⚠ This may include faculty from other colleges!")
-        word_sections = soup.find_all('div', class_=lambda x: x and x.startswith('WordSection'))
+        word_sections = _word_sections(root)
         if word_sections:
             sections_to_scrape = word_sections
             print(f"  Found {len(word_sections)} WordSection divs total")
         else:
             # Last resort: scrape entire page
-            sections_to_scrape = [soup]
+            sections_to_scrape = [root]
             print(f"  No WordSection divs found, scraping entire page")
     
     # Scrape paragraphs from target sections
     for i, section in enumerate(sections_to_scrape):
-        paragraphs = section.find_all('p')
+        paragraphs = section.findall('.//p')
         print(f"  Section {i+1}: found {len(paragraphs)} paragraphs")
         
         for p in paragraphs:
-            # Get the text content
-            text = p.get_text(strip=True)
+            # Get the text content, stripping and joining each text node
+            text = ''.join(t.strip() for t in p.itertext())
             
             # Skip empty paragraphs
             if not text:
@@ -349,7 +412,12 @@ def scrape_faculty(url: str, departments: Dict[str, str]) -> List[Dict[str, str]
             if faculty_data:
                 faculty_list.append(faculty_data)
             else:
-                print(f"  ⚠ Could not parse: {text[:60]}...")
+                unparsed.append(text[:60])
+    
+    if unparsed:
+        print(f"  ⚠ {len(unparsed)} paragraphs not parsed")
+        if VERBOSE:
+            sys.stdout.write(''.join(f"  ⚠ Could not parse: {t}...\n" for t in unparsed))
     
     print(f"✓ Successfully parsed {len(faculty_list)} faculty entries")
     return faculty_list
@@ -378,7 +446,12 @@ def save_to_csv(faculty_list: List[Dict[str, str]], output_path: str, start_id:
         'academic_history'
     ]
     
-    with open(output_path, mode, newline='', encoding='utf-8') as f:
+    # Assign sequential IDs, formatted in one pass
+    ids = [f"{FACULTY_ID_PREFIX}{i:05d}" for i in range(start_id, start_id + len(faculty_list))]
+    for faculty_id, faculty in zip(ids, faculty_list):
+        faculty['faculty_id'] = faculty_id
+    
+    with open(output_path, mode, newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         
         # Write header only if creating new file
@@ -386,9 +459,7 @@ def save_to_csv(faculty_list: List[Dict[str, str]], output_path: str, start_id:
             writer.writeheader()
         
         # Write faculty entries with sequential IDs
-        for i, faculty in enumerate(faculty_list, start=start_id):
-            faculty['faculty_id'] = format_faculty_id(i)
-            writer.writerow(faculty)
+        writer.writerows(faculty_list)
     
     print(f"Saved {len(faculty_list)} faculty entries to {output_path}")
     print(f"Faculty IDs: {format_faculty_id(start_id)} to {format_faculty_id(start_id + len(faculty_list) - 1)}")
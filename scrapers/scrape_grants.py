@@ -33,13 +33,16 @@ NOTES:
     - Dates are converted from "January 12, 2026" to "2026-01-12"
 """
 
-from bs4 import BeautifulSoup
+from lxml import etree
 import csv
+import io
+import logging
+import mmap
 import os
 import re
 import sys
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from calendar import monthrange
+from typing import Iterator, List, Dict, Optional, Tuple
 
 # ============================================================================
 # CONFIGURATION
@@ -48,10 +51,61 @@ from typing import List, Dict, Optional, Tuple
 OUTPUT_FILE = "../data/csv/grants_cec.csv"
 GRANT_ID_PREFIX = "G"
 
+# Parsing warnings and progress go through logging; main() prints them to stdout
+log = logging.getLogger(__name__)
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Any bold paragraph mentioning "receive" starts a new entry, including
+# blocks like "X receives support from ..." that aren't grants themselves
+_RE_RECEIVE = re.compile(r'receive', re.IGNORECASE)
+
+# "receives/received funding from" marks a grant's detail line
+_RE_RECEIVE_FOR = re.compile(r'receive[sd]?\s+funding\s+from', re.IGNORECASE)
+
+# [Name(s)] receive(s)/received funding from [Source] for [Title] is cut
+# into pieces at these two separators instead of with one backtracking regex
+_RE_RECEIVE_SPAN = re.compile(r'\s+receive[sd]?\s+funding\s+from\s+', re.IGNORECASE)
+_RE_FOR = re.compile(r'\s+for\s+', re.IGNORECASE)
+
+# Lowercased keywords that introduce a funding amount ("Grant total: $X")
+_FUNDING_KEYWORDS = ('anticipated funding', 'grant total', 'award amount', 'award')
+
+# Any of the funding keywords, matched case-insensitively in place so match
+# positions index the original title (str.lower() can change its length)
+_RE_FUNDING_KEYWORD = re.compile('|'.join(map(re.escape, _FUNDING_KEYWORDS)), re.IGNORECASE)
+
+# Old format funding inside the detail line ("... Grant total: $X.")
+_RE_DETAIL_FUNDING = re.compile(
+    r'(Grant total|Anticipated funding|Award amount)[:\s]+\$\s*([\d,]+)',
+    re.IGNORECASE,
+)
+
+# "Anticipated" in a funding line, matched without lowercasing the whole line
+_RE_ANTICIPATED = re.compile(r'anticipated', re.IGNORECASE)
+
+# Dollar amounts like $100,000 or $1,500 or $1.5M
+_RE_AMOUNT = re.compile(r'\$\s*([\d,]+(?:\.\d+)?)\s*([MmKk])?')
+
+# "Month DD, YYYY" dates, with month, day and year captured
+_RE_DATE_SHAPE = re.compile(r'^([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})$')
+
+# Full English month names, lowercased, to month numbers
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+# Separators between awardee names: " and " (any whitespace around it) or a comma
+_RE_NAME_SEP = re.compile(r'\s+and(?=\s)|,')
+
+# A standalone four-digit year
+_RE_YEAR = re.compile(r'\b\d{4}\b')
+
+
 def parse_date(date_str: str) -> str:
     """
     Convert date from 'January 12, 2026' to '2026-01-12' (ISO format).
@@ -62,13 +116,20 @@ def parse_date(date_str: str) -> str:
     Returns:
         ISO format date string "YYYY-MM-DD"
     """
-    try:
-        date_obj = datetime.strptime(date_str.strip(), "%B %d, %Y")
-        return date_obj.strftime("%Y-%m-%d")
-    except ValueError:
-        # If parsing fails, return the original string
-        print(f"  ⚠ Warning: Could not parse date '{date_str}'")
-        return date_str.strip()
+    date_str = date_str.strip()
+    
+    # Parse the fixed English format directly rather than through strptime
+    match = _RE_DATE_SHAPE.match(date_str)
+    if match:
+        month = _MONTHS.get(match.group(1).lower())
+        day = int(match.group(2))
+        year = int(match.group(3))
+        if month and year and 1 <= day <= monthrange(year, month)[1]:
+            return f"{year:04d}-{month:02d}-{day:02d}"
+    
+    # If parsing fails, return the original string
+    log.warning("  ⚠ Warning: Could not parse date '%s'", date_str)
+    return date_str
 
 
 def parse_funding_amount(amount_str: str) -> Tuple[Optional[int], bool]:
@@ -82,17 +143,22 @@ def parse_funding_amount(amount_str: str) -> Tuple[Optional[int], bool]:
         Tuple of (amount as integer, is_anticipated boolean)
     """
     # Check if it's anticipated or awarded
-    is_anticipated = "anticipated" in amount_str.lower()
+    is_anticipated = _RE_ANTICIPATED.search(amount_str) is not None
     
     # Extract the dollar amount
     # Match patterns like $100,000 or $1,500 or $1.5M
-    match = re.search(r'\$\s*([\d,]+(?:\.\d+)?)\s*([MmKk])?', amount_str)
+    match = _RE_AMOUNT.search(amount_str)
     
     if match:
         amount_str = match.group(1).replace(',', '')
         multiplier = match.group(2)
         
         try:
+            # Whole-dollar amounts without a suffix (the common case) skip the
+            # float round trip
+            if not multiplier and '.' not in amount_str:
+                return (int(amount_str), is_anticipated)
+
             amount = float(amount_str)
             
             # Handle M (millions) and K (thousands) suffixes
@@ -104,7 +170,7 @@ def parse_funding_amount(amount_str: str) -> Tuple[Optional[int], bool]:
             
             return (int(amount), is_anticipated)
         except ValueError:
-            print(f"  ⚠ Warning: Could not parse amount '{amount_str}'")
+            log.warning("  ⚠ Warning: Could not parse amount '%s'", amount_str)
             return (None, is_anticipated)
     
     return (None, is_anticipated)
@@ -125,17 +191,10 @@ def parse_awardees(awardee_str: str) -> List[str]:
     Returns:
         List of individual faculty names
     """
-    # Split on " and " and commas
-    # First replace " and " with a comma for uniform splitting
-    normalized = awardee_str.replace(' and ', ', ')
-    
-    # Split on commas
-    names = [name.strip() for name in normalized.split(',')]
-    
-    # Filter out empty strings and common words
-    names = [name for name in names if name and name.lower() not in ['', 'and']]
-    
-    return names
+    # Split on " and " and commas in one pass, filtering out empty strings
+    # and a stray "and"
+    return [name for name in map(str.strip, _RE_NAME_SEP.split(awardee_str))
+            if name and name.lower() != 'and']
 
 
 def parse_grant_entry(entry_text: str) -> Optional[Dict[str, any]]:
@@ -160,49 +219,70 @@ def parse_grant_entry(entry_text: str) -> Optional[Dict[str, any]]:
     Returns:
         Dictionary with parsed grant data or None if parsing fails
     """
-    lines = [line.strip() for line in entry_text.split('\n') if line.strip()]
+    lines = [line for line in map(str.strip, entry_text.split('\n')) if line]
+    return parse_grant_entry_from_lines(lines)
+
+
+def parse_grant_entry_from_lines(lines: List[str]) -> Optional[Dict[str, any]]:
+    """
+    Parse a single grant entry that is already split into lines.
+    
+    Same as parse_grant_entry(), for callers that collect an entry line by
+    line and would otherwise join it only to have it split again.
     
+    Args:
+        lines: Stripped, non-empty lines of a grant entry
+    
+    Returns:
+        Dictionary with parsed grant data or None if parsing fails
+    """
     if len(lines) < 2:
         return None
     
+    # Lowercase each line once for all the keyword checks below
+    lines_lower = [line.lower() for line in lines]
+    
     # Try to find the detail line (contains "received funding from" or "receives funding from")
     # Prefer lines that also contain "for" (those have the title)
     detail_line = None
     detail_line_idx = -1
     
-    # First pass: look for lines with both "receive" and "for"
-    for i, line in enumerate(lines):
-        if re.search(r'receive[sd]?\s+funding\s+from', line, re.IGNORECASE) and ' for ' in line.lower():
-            detail_line = line
-            detail_line_idx = i
-            break
-    
-    # Second pass: if not found, accept any line with "receive"
-    if not detail_line:
-        for i, line in enumerate(lines):
-            if re.search(r'receive[sd]?\s+funding\s+from', line, re.IGNORECASE):
+    # Single pass: keep the first line with "receive", but switch to the
+    # first one that also has "for" and stop there
+    for i, (line, line_lower) in enumerate(zip(lines, lines_lower)):
+        if _RE_RECEIVE_FOR.search(line):
+            if ' for ' in line_lower:
                 detail_line = line
                 detail_line_idx = i
                 break
+            if detail_line is None:
+                detail_line = line
+                detail_line_idx = i
     
     if not detail_line:
         return None
     
     # Pattern: [Name(s)] receive(s)/received funding from [Source] for [Title]
-    # Title should stop before funding amount keywords
-    pattern = r'^(.+?)\s+receive[sd]?\s+funding\s+from\s+(.+?)(?:\s+for\s+(.+?))?(?:\s*(?:Anticipated funding|Grant total|Award amount|Award))?\.?\s*$'
-    match = re.search(pattern, detail_line, re.IGNORECASE)
+    match = _RE_RECEIVE_SPAN.search(detail_line)
     
     if not match:
         return None
     
-    awardee_str = match.group(1)
-    sponsor = match.group(2)
-    title = match.group(3) if match.group(3) else ""
+    awardee_str = detail_line[:match.start()]
+    rest = detail_line[match.end():]
+    
+    # Sponsor runs up to the first " for ", the title is everything after it
+    match = _RE_FOR.search(rest)
+    if match:
+        sponsor = rest[:match.start()]
+        title = strip_detail_tail(rest[match.end():])
+    else:
+        sponsor = strip_detail_tail(rest)
+        title = ""
     
     # Clean up title - remove quotes, funding amounts, and trailing periods
     # Remove funding information if it got captured in title
-    title = re.sub(r'[."\']?\s*(?:Anticipated funding|Grant total|Award amount|Award)[:\s]+\$.*$', '', title, flags=re.IGNORECASE)
+    title = strip_funding_suffix(title)
     title = title.strip().strip('"').strip("'").rstrip('.')
     
     # Find funding amount
@@ -211,13 +291,13 @@ def parse_grant_entry(entry_text: str) -> Optional[Dict[str, any]]:
     is_anticipated = False
     
     # Check detail line first (old format: "... for Title. Grant total: $X.")
-    detail_funding_match = re.search(r'(Grant total|Anticipated funding|Award amount)[:\s]+\$\s*([\d,]+)', detail_line, re.IGNORECASE)
+    detail_funding_match = _RE_DETAIL_FUNDING.search(detail_line)
     if detail_funding_match:
         funding, is_anticipated = parse_funding_amount(detail_funding_match.group(0))
     else:
         # Check other lines (new format)
-        for line in lines:
-            if '$' in line and ('funding' in line.lower() or 'award' in line.lower() or 'grant' in line.lower()):
+        for line, line_lower in zip(lines, lines_lower):
+            if '$' in line and ('funding' in line_lower or 'award' in line_lower or 'grant' in line_lower):
                 funding, is_anticipated = parse_funding_amount(line)
                 if funding:
                     break
@@ -226,20 +306,19 @@ def parse_grant_entry(entry_text: str) -> Optional[Dict[str, any]]:
     date = None
     
     # Try to find date in separate line first
-    for line in reversed(lines):
+    for line, line_lower in zip(reversed(lines), reversed(lines_lower)):
         # Skip lines with dollar signs or "funding" (those are amount lines)
-        if '$' in line or 'funding' in line.lower():
+        if '$' in line or 'funding' in line_lower:
             continue
-        # Try to parse as date
-        try:
-            # Date might have period at end
-            clean_line = line.rstrip('.')
-            parsed_date = parse_date(clean_line)
-            if parsed_date != clean_line:  # Successfully parsed
-                date = parsed_date
-                break
-        except:
+        # Date might have period at end
+        clean_line = line.rstrip('.')
+        # Skip lines that can't be a date before trying to parse them
+        if not _RE_DATE_SHAPE.match(clean_line):
             continue
+        parsed_date = parse_date(clean_line)
+        if parsed_date != clean_line:  # Successfully parsed
+            date = parsed_date
+            break
     
     # Parse individual awardees
     awardees = parse_awardees(awardee_str)
@@ -254,9 +333,67 @@ def parse_grant_entry(entry_text: str) -> Optional[Dict[str, any]]:
     }
 
 
+def strip_detail_tail(text: str) -> str:
+    """
+    Remove a bare funding keyword and/or one trailing period from the end of
+    a detail line piece (sponsor or title).
+    
+    At least one character is always kept, so a piece that is nothing but
+    a keyword is returned without its period only.
+    
+    Args:
+        text: End of a detail line, e.g. 'NSF Award.' or '"Some Title."'
+    
+    Returns:
+        Text without the trailing keyword and period
+    """
+    end = len(text) - 1 if text.endswith('.') else len(text)
+    
+    for keyword in _FUNDING_KEYWORDS:
+        start = end - len(keyword)
+        if start > 0 and text[start:end].lower() == keyword:
+            cut = len(text[:start].rstrip())
+            if cut:
+                return text[:cut]
+            break
+    
+    return text[:end] if end else text
+
+
+def strip_funding_suffix(title: str) -> str:
+    """
+    Remove funding information that got captured at the end of a title.
+    
+    Cuts at the first funding keyword followed by ':' and/or whitespace and
+    a '$', together with the whitespace and one '.', '"' or "'" before it.
+    
+    Args:
+        title: Title text, possibly ending in e.g. '. Grant total: $5,000.'
+    
+    Returns:
+        Title without the funding suffix
+    """
+    match = _RE_FUNDING_KEYWORD.search(title)
+    while match:
+        i = end = match.end()
+        while i < len(title) and (title[i] == ':' or title[i].isspace()):
+            i += 1
+        if i > end and title.startswith('$', i):
+            break
+        match = _RE_FUNDING_KEYWORD.search(title, match.start() + 1)
+    
+    if not match:
+        return title
+    
+    title = title[:match.start()].rstrip()
+    if title.endswith(('.', '"', "'")):
+        title = title[:-1]
+    return title
+
+
 def format_grant_id(number: int) -> str:
     """Format grant ID with leading zeros (e.g., 1 -> G00001)"""
-    return f"{GRANT_ID_PREFIX}{number:05d}"
+    return GRANT_ID_PREFIX + str(number).zfill(5)
 
 
 def scrape_grants_from_file(file_path: str) -> List[Dict[str, any]]:
@@ -281,15 +418,46 @@ def scrape_grants_from_file(file_path: str) -> List[Dict[str, any]]:
         print(f"  5. Run: python3 scrape_grants.py {file_path}")
         return []
     
+    # Map the file instead of reading it, so lxml consumes the raw bytes
+    # without a copy into a Python string
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        with open(file_path, 'rb') as f:
+            html_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except Exception as e:
         print(f"✗ Error reading file: {e}")
         return []
     
-    print(f"  File size: {len(html_content):,} characters")
-    return parse_html_content(html_content)
+    print(f"  File size: {len(html_content):,} bytes")
+    with html_content:
+        return parse_html_content(html_content)
+
+
+def iter_paragraphs(html_content) -> Iterator[etree._Element]:
+    """
+    Stream <p> elements out of HTML content without keeping the whole DOM.
+    
+    Each paragraph is yielded once it is complete and cleared afterwards,
+    together with any finished siblings before it, so memory stays roughly
+    constant regardless of page size.
+    
+    Args:
+        html_content: HTML content (bytes, string or binary file object)
+    
+    Yields:
+        Completed <p> elements (only valid until the next one is requested)
+    """
+    if isinstance(html_content, str):
+        html_content = html_content.encode('utf-8')
+    if isinstance(html_content, bytes):
+        html_content = io.BytesIO(html_content)
+    
+    context = etree.iterparse(html_content, events=('end',), tag='p',
+                              html=True, encoding='utf-8')
+    for _, elem in context:
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
 
 
 def parse_html_content(html_content) -> List[Dict[str, any]]:
@@ -297,102 +465,120 @@ def parse_html_content(html_content) -> List[Dict[str, any]]:
     Parse grant entries from HTML content.
     
     Args:
-        html_content: HTML content (bytes or string)
+        html_content: HTML content (bytes, string or binary file object)
     
     Returns:
         List of grant dictionaries
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
     grants_list = []
     
-    # Find the main content div
     # Based on the HTML structure, grants are in <p> tags with various formats:
     # - Newer entries: <p class="MsoNormal"> or <p class="p1">
     # - Older entries: <p><span> (no class attribute)
     # Each grant is typically 2-4 lines separated by <hr> tags
     
-    # Find all paragraph tags that might contain grants
-    # Include both paragraphs with classes AND paragraphs without classes
-    all_paragraphs = soup.find_all('p')
-    
-    print(f"  Found {len(all_paragraphs)} paragraph elements total")
-    
-    # Filter to only content paragraphs (skip navigation, headers, etc.)
-    # Keep paragraphs that either:
-    # 1. Have a class like MsoNormal, p1, p2
-    # 2. Have a <span> child (older grant format)
-    # 3. Have <strong> child (grant headers)
-    paragraphs = []
-    for p in all_paragraphs:
-        has_class = p.get('class') and any(cls in ['MsoNormal', 'p1', 'p2'] for cls in p.get('class', []))
-        has_span = p.find('span') is not None
-        has_strong = p.find('strong') is not None
-        
-        if has_class or has_span or has_strong:
-            paragraphs.append(p)
-    
-    print(f"  Filtered to {len(paragraphs)} relevant paragraphs")
+    # Paragraphs are streamed in document order and handled as they arrive
+    paragraph_count = 0
+    relevant_count = 0
     
+    # Lines of the entry being built, and how many paragraphs they came from
     current_entry_lines = []
+    current_entry_paragraphs = 0
     entry_count = 0
     
-    for i, p in enumerate(paragraphs):
-        # Use separator to properly handle <br> tags
-        text = p.get_text(separator='\n', strip=True)
+    # Whether the current entry has a dollar amount / a year yet, updated as
+    # paragraphs are added so earlier lines are never rescanned
+    has_funding = False
+    has_date = False
+    
+    # Set once the current entry has parsed but without a date; it is only
+    # retried when a paragraph with a year arrives. An entry that didn't
+    # parse at all (no detail line yet) is retried on every paragraph
+    parse_failed = False
+    
+    for p in iter_paragraphs(html_content):
+        paragraph_count += 1
+        
+        # Filter to only content paragraphs (skip navigation, headers, etc.)
+        # Keep paragraphs that either:
+        # 1. Have a class like MsoNormal, p1, p2
+        # 2. Have a <span> child (older grant format)
+        # 3. Have <strong> child (grant headers)
+        # Each check is a DOM search, so stop at the first one that passes
+        has_strong = p.find('.//strong') is not None
+        if not (has_strong
+                or any(cls in ('MsoNormal', 'p1', 'p2') for cls in (p.get('class') or '').split())
+                or p.find('.//span') is not None):
+            continue
+        relevant_count += 1
+        
+        # One line per text node, which keeps <br>-separated lines apart, and
+        # text nodes that wrap in the HTML source are split at their line breaks
+        p_lines = [line for t in p.itertext() for line in map(str.strip, t.split('\n')) if line]
         
         # Skip empty paragraphs
-        if not text:
+        if not p_lines:
             continue
         
         # Check if this is the start of a new grant entry (bold header with "receives")
         # This is typically in a <strong> tag
-        is_header = p.find('strong') is not None and 'receive' in text.lower()
+        is_header = has_strong and any(_RE_RECEIVE.search(line) for line in p_lines)
         
         if is_header:
             # This is the start of a new entry
             if current_entry_lines:
                 # Parse the previous entry
-                entry_text = '\n'.join(current_entry_lines)
-                parsed = parse_grant_entry(entry_text)
+                parsed = parse_grant_entry_from_lines(current_entry_lines)
                 if parsed:
                     grants_list.append(parsed)
                     entry_count += 1
             
             # Start new entry
-            current_entry_lines = [text]
+            current_entry_lines = p_lines
+            current_entry_paragraphs = 1
+            has_funding = any('$' in line for line in p_lines)
+            has_date = any(_RE_YEAR.search(line) for line in p_lines)
+            parse_failed = False
         else:
             # Continue building current entry
             if current_entry_lines:
-                current_entry_lines.append(text)
+                current_entry_lines.extend(p_lines)
+                current_entry_paragraphs += 1
+                has_funding = has_funding or any('$' in line for line in p_lines)
+                p_has_year = any(_RE_YEAR.search(line) for line in p_lines)
+                has_date = has_date or p_has_year
                 
                 # Old format entries are only 2 lines, new format can be 3-4 lines
                 # Try to parse after collecting 2-4 lines
-                if len(current_entry_lines) >= 2:
+                if current_entry_paragraphs >= 2:
                     # Check if this looks complete (has both funding and date)
-                    entry_text = '\n'.join(current_entry_lines)
-                    
                     # Old format: detail line contains both funding amount and date info
                     # New format: separate lines for funding and date
-                    has_funding = any('$' in line for line in current_entry_lines)
-                    has_date = any(re.search(r'\b\d{4}\b', line) for line in current_entry_lines)
-                    
                     # If we have both funding and date, or we've collected 4+ lines, try to parse
-                    if (has_funding and has_date) or len(current_entry_lines) >= 4:
-                        parsed = parse_grant_entry(entry_text)
+                    # A date line always contains a year, so an entry that already
+                    # failed can't succeed until a paragraph with a year is added
+                    if ((has_funding and has_date) or current_entry_paragraphs >= 4) \
+                            and (not parse_failed or p_has_year):
+                        parsed = parse_grant_entry_from_lines(current_entry_lines)
                         if parsed and parsed.get('date'):  # Only accept if we got a date
                             grants_list.append(parsed)
                             entry_count += 1
                             current_entry_lines = []  # Reset for next entry
+                            current_entry_paragraphs = 0
+                            has_funding = has_date = False
+                        elif parsed:
+                            parse_failed = True
     
     # Don't forget the last entry
-    if current_entry_lines and len(current_entry_lines) >= 2:
-        entry_text = '\n'.join(current_entry_lines)
-        parsed = parse_grant_entry(entry_text)
+    if current_entry_lines and current_entry_paragraphs >= 2:
+        parsed = parse_grant_entry_from_lines(current_entry_lines)
         if parsed:
             grants_list.append(parsed)
             entry_count += 1
     
-    print(f"✓ Successfully parsed {len(grants_list)} grant entries")
+    log.info("  Found %d paragraph elements total", paragraph_count)
+    log.info("  Filtered to %d relevant paragraphs", relevant_count)
+    log.info("✓ Successfully parsed %d grant entries", len(grants_list))
     return grants_list
 
 
@@ -420,50 +606,27 @@ def save_to_csv(grants_list: List[Dict[str, any]], output_path: str):
         'capabilities_id'
     ]
     
-    rows = []
-    grant_counter = 1
-    
-    # Expand grants with multiple awardees into separate rows
-    for grant in grants_list:
-        awardees = grant.get('awardees', [])
+    # Expand grants with multiple awardees into separate rows, in fieldnames
+    # order, and stream them straight to the file through a 1 MiB buffer
+    total_written = 0
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
         
-        if not awardees:
-            # No awardees found, create one row with empty awardee
-            rows.append({
-                'grant_id': format_grant_id(grant_counter),
-                'funding': grant.get('funding', ''),
-                'sponsor': grant.get('sponsor', ''),
-                'awardee': '',
-                'title': grant.get('title', ''),
-                'date': grant.get('date', ''),
-                'is_anticipated': grant.get('is_anticipated', False),
-                'department_id': '',
-                'capabilities_id': ''
-            })
-            grant_counter += 1
-        else:
-            # Create one row per awardee
-            for awardee in awardees:
-                rows.append({
-                    'grant_id': format_grant_id(grant_counter),
-                    'funding': grant.get('funding', ''),
-                    'sponsor': grant.get('sponsor', ''),
-                    'awardee': awardee,
-                    'title': grant.get('title', ''),
-                    'date': grant.get('date', ''),
-                    'is_anticipated': grant.get('is_anticipated', False),
-                    'department_id': '',
-                    'capabilities_id': ''
-                })
-                grant_counter += 1
-    
-    # Write to CSV
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    
-    print(f"✓ Saved {len(rows)} grant records to {output_path}")
+        for grant in grants_list:
+            funding = grant.get('funding', '')
+            sponsor = grant.get('sponsor', '')
+            title = grant.get('title', '')
+            date = grant.get('date', '')
+            is_anticipated = grant.get('is_anticipated', False)
+            
+            # One row per awardee, or a single row with empty awardee if none found
+            for awardee in grant.get('awardees') or ['']:
+                total_written += 1
+                writer.writerow((format_grant_id(total_written), funding, sponsor, awardee,
+                                 title, date, is_anticipated, '', ''))
+    
+    print(f"✓ Saved {total_written} grant records to {output_path}")
     print(f"  (From {len(grants_list)} unique grants with multiple awardees expanded)")
 
 
@@ -473,6 +636,8 @@ def save_to_csv(grants_list: List[Dict[str, any]], output_path: str):
 
 def main():
     """Main execution function"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("=" * 70)
     print("GMU CEC Grants Web Scraper - Offline Mode")
     print("=" * 70)
@@ -0,0 +1,58 @@
+import os
+import sys
+import unittest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, "scrapers"))
+
+import scrape_faculty  # noqa: E402
+
+DEPARTMENTS = scrape_faculty.load_departments(
+    os.path.join(REPO_DIR, "data", "csv", "departments.csv"))
+
+
+class FuzzyMatchDepartmentTest(unittest.TestCase):
+    def test_plain_title_is_not_a_department(self):
+        self.assertIsNone(scrape_faculty.fuzzy_match_department("Associate Professor", DEPARTMENTS))
+
+    def test_title_with_department_after_in(self):
+        # Shape of F00231 in data/csv/faculty.csv
+        entry = scrape_faculty.parse_faculty_entry(
+            "Doe, Jane, Associate Professor in Systems Engineering and Operations Research, "
+            "College of Engineering and Computing. PhD 2010, MIT.",
+            DEPARTMENTS,
+        )
+        self.assertEqual(entry["department_id"], "D00001")
+
+
+class ParseFacultyEntryTest(unittest.TestCase):
+    def test_entry_wrapped_across_lines(self):
+        entry = scrape_faculty.parse_faculty_entry(
+            "Smith, John\nM., Associate Professor, Computer Science, "
+            "College of Engineering and Computing. PhD 2001, MIT.",
+            DEPARTMENTS,
+        )
+        self.assertEqual(entry["first_name"], "John M.")
+        self.assertEqual(entry["title"], "Associate Professor")
+        self.assertEqual(entry["department_id"], "D00003")
+
+    def test_quoted_field_keeps_its_commas(self):
+        entry = scrape_faculty.parse_faculty_entry(
+            'Smith, Bob, "Director, Lab", Computer Science, '
+            "College of Engineering and Computing. PhD 2001, MIT.",
+            DEPARTMENTS,
+        )
+        self.assertEqual(entry["title"], "Director, Lab")
+        self.assertEqual(entry["department_id"], "D00003")
+
+    def test_quotes_inside_unquoted_field_are_kept(self):
+        entry = scrape_faculty.parse_faculty_entry(
+            'Smith, "Bob" Robert, Associate Professor, Computer Science, '
+            "College of Engineering and Computing. PhD 2001, MIT.",
+            DEPARTMENTS,
+        )
+        self.assertEqual(entry["first_name"], '"Bob" Robert')
+
+
+if __name__ == "__main__":
+    unittest.main()
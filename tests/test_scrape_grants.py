@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, "scrapers"))
+
+import scrape_grants  # noqa: E402
+
+
+class StripFundingSuffixTest(unittest.TestCase):
+    def test_strips_funding_suffix(self):
+        self.assertEqual(scrape_grants.strip_funding_suffix("Widgets. Grant total: $5,000."), "Widgets")
+
+    def test_cut_point_with_length_changing_lowercase(self):
+        # 'İ'.lower() is two code points, which must not shift the cut
+        self.assertEqual(
+            scrape_grants.strip_funding_suffix("İzmir İstanbul bridge study. Grant total: $5,000."),
+            "İzmir İstanbul bridge study",
+        )
+
+
+class ParseHtmlContentTest(unittest.TestCase):
+    def test_non_grant_receive_block_ends_previous_entry(self):
+        html = """<html><body>
+<p class="MsoNormal"><strong>Ann Lee receives funding from NSF</strong></p>
+<p class="MsoNormal">Ann Lee received funding from NSF for Widgets.</p>
+<p class="MsoNormal">Anticipated funding: $10,000</p>
+<p class="MsoNormal"><strong>Bob Ray receives support from FHWA</strong></p>
+<p class="MsoNormal">March 3, 2024</p>
+</body></html>"""
+        grants = scrape_grants.parse_html_content(html)
+        self.assertEqual(len(grants), 1)
+        self.assertEqual(grants[0]["awardees"], ["Ann Lee"])
+        self.assertIsNone(grants[0]["date"])
+
+    def test_entry_retried_once_detail_line_arrives(self):
+        html = """<html><body>
+<p class="MsoNormal"><strong>Jane Roe receives NSF CAREER award</strong></p>
+<p class="MsoNormal">Award amount: $500,000</p>
+<p class="MsoNormal">January 5, 2024</p>
+<p class="MsoNormal">Jane Roe received funding from NSF for Widgets.</p>
+<p class="MsoNormal">Other news item</p>
+<p class="MsoNormal">March 3, 2025</p>
+</body></html>"""
+        grants = scrape_grants.parse_html_content(html)
+        self.assertEqual(len(grants), 1)
+        self.assertEqual(grants[0]["title"], "Widgets")
+        self.assertEqual(grants[0]["date"], "2024-01-05")
+
+    def test_wrapped_text_node_is_split_into_lines(self):
+        html = """<html><body>
+<p class="p1"><strong>Al Bo receives funding from DOE</strong></p>
+<p class="p1">Al Bo received funding from DOE for Gadget
+studies.</p>
+<p class="p1">Award amount $5,000</p>
+<p class="p1">May 1, 2023</p>
+</body></html>"""
+        grants = scrape_grants.parse_html_content(html)
+        self.assertEqual(len(grants), 1)
+        self.assertNotIn("\n", grants[0]["title"])
+        self.assertEqual(grants[0]["date"], "2023-05-01")
+
+
+if __name__ == "__main__":
+    unittest.main()